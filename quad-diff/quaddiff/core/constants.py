@@ -6,3 +6,4 @@ VELOCITY_SCALE = 0.02
 MAX_INT = 500
 LIM = 30
 MAX_STEP = 0.3
+METHOD = 'RK45'
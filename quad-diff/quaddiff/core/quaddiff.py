@@ -5,6 +5,8 @@ import os
 import json
 from cmath import *
 
+import numpy as np
+
 from ..utils import INF
 
 
@@ -27,6 +29,8 @@ class QuadraticDifferential(object):
         if phase is not None:
             self.phase = phase
 
+        # Cached complex arrays of zeros and poles
+        self._arrays_key = None
 
     def __repr__(self):
         """Quadratic Differential representation string."""
@@ -45,35 +49,53 @@ class QuadraticDifferential(object):
         if self.size == 0:
             msg = "Quadratic Differential is empty:\n {}".format(self)
 
+        zeros, smplpoles, dblpoles = self._arrays()
+
         # Remove argument from list of zeros if ignore_zero
-        zeros = self.zeros
         if z in self.zeros:
             if ignore_zero:
-                zeros = [zero for zero in self.zeros if zero != z]
+                zeros = zeros[zeros != z]
             else:
                 return 0.0
 
         # Select Quad Diff phase if no phase has been given
         phase = self.phase if phase is None else phase
 
-        # Multiply all normalized zero's monomials
-        zero_contrib = reduce(
-            lambda x, y: x * (z - y) / abs(z - y),
-            zeros, 1)
-
-        try:
-            dblpoles_contrib = reduce(
-                lambda x, y: x * ((z - y) / abs(z - y))**(-2),
-                self.dblpoles, 1)
-            smplpoles_contrib = reduce(
-                lambda x, y: x * ((z - y) / abs(z - y))**(-1),
-                self.smplpoles, 1)
-
         # If z is a pole return INF(nity)
-        except ZeroDivisionError:
+        if z in self.dblpoles or z in self.smplpoles:
             return INF
 
-        return phase * zero_contrib * dblpoles_contrib * smplpoles_contrib
+        value = phase
+
+        # Multiply all normalized zero's monomials
+        if zeros.size:
+            diff = z - zeros
+            value *= (diff / np.abs(diff)).prod()
+
+        # Poles contribute the conjugate of its normalized monomials
+        if dblpoles.size:
+            diff = z - dblpoles
+            value *= (diff / np.abs(diff)).prod().conjugate()**2
+
+        if smplpoles.size:
+            diff = z - smplpoles
+            value *= (diff / np.abs(diff)).prod().conjugate()
+
+        return complex(value)
+
+    def _arrays(self):
+        """Return zeros, simple poles and double poles as complex arrays.
+
+        The arrays are cached and only rebuilt when the contents of the
+        zero or pole lists change, however they were modified.
+        """
+        key = (tuple(self.zeros), tuple(self.smplpoles), tuple(self.dblpoles))
+        if key != self._arrays_key:
+            self._zeros_arr = np.asarray(self.zeros, dtype=np.complex128)
+            self._smpl_arr = np.asarray(self.smplpoles, dtype=np.complex128)
+            self._dbl_arr = np.asarray(self.dblpoles, dtype=np.complex128)
+            self._arrays_key = key
+        return self._zeros_arr, self._smpl_arr, self._dbl_arr
 
     def add_zero(self, z):
         self.zeros.append(complex(z))
@@ -84,20 +106,14 @@ class QuadraticDifferential(object):
     def add_smplpole(self, z):
         self.smplpoles.append(complex(z))
 
-    def _close_2dblpole(self, z):
-        for x in self.dblpoles:
-            if abs(z-x) < self.sensitivity:
-                return True
-        return False
-
-    def _close_2smplpole(self, z):
-        for x in self.smplpoles:
-            if abs(z-x) < self.sensitivity:
-                return True
-        return False
+    def _close_2points(self, z, points):
+        return bool((np.abs(z - points) < self.sensitivity).any())
 
     def close_2pole(self, z):
-        return self._close_2smplpole(z) | self._close_2dblpole(z)
+        _, smplpoles, dblpoles = self._arrays()
+        return (
+            self._close_2points(z, smplpoles) or
+            self._close_2points(z, dblpoles))
 
     def save(self, path, name='quad_diff'):
         fname = os.path.join(path, name + '.json')
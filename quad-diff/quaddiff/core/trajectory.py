@@ -1,12 +1,22 @@
 """Trajectory Module."""
 
 import sys
+import atexit
+import logging
+import math
+import multiprocessing as mp
 import numpy as np
 from cmath import *
+from numba import njit
 from scipy.integrate import solve_ivp
 
 from .monodromy import Monodromy
 from .constants import *
+from ..utils import MethodProxy
+
+# Worker pool shared by all solvers, created on the first parallel
+# calculation and shut down at exit
+_POOL = None
 
 
 class TrajectorySolver(object):
@@ -17,11 +27,15 @@ class TrajectorySolver(object):
         'velocity_scale': VELOCITY_SCALE,
         'num_points': NUM_POINTS,
         'lim': LIM,
-        'max_step': MAX_STEP}
+        'max_step': MAX_STEP,
+        'method': METHOD}
 
     def __init__(self, quad):
         self.qd = quad
 
+        # Compile the integration kernels before any worker is forked
+        _compile_kernels()
+
     def calculate(self, point, phase=None):
         """Calculate trayectory."""
         if phase is None:
@@ -32,7 +46,8 @@ class TrajectorySolver(object):
         negative_trajectory = calculate_ray(
             point, self.qd, sign=-1, parameters=self.parameters, phase=phase)
 
-        trajectory = list(reversed(negative_trajectory)) + positive_trajectory[1:]
+        trajectory = np.concatenate(
+            [negative_trajectory[::-1], positive_trajectory[1:]])
 
         return trajectory
 
@@ -40,6 +55,67 @@ class TrajectorySolver(object):
         point, phase = arg
         return self.calculate(point, phase=phase)
 
+    def _calculate_indexed(self, indexed_arg):
+        index, arg = indexed_arg
+        return index, self._calculate(arg)
+
+    def parallel_calculate(self, arguments):
+        """Calculate the trajectories of (point, phase) pairs in parallel.
+
+        Returns the trajectories in the same order as the arguments.
+        """
+        arguments = list(arguments)
+        if not arguments:
+            return []
+
+        pickable_method = MethodProxy(self, self._calculate_indexed)
+
+        # Send work in chunks to reduce the pickling round trips
+        chunksize = max(1, len(arguments) // (mp.cpu_count() + 2))
+
+        # Workers return the argument index, results may arrive in any order
+        results = [None] * len(arguments)
+        for index, trajectory in _get_pool().imap_unordered(
+                pickable_method, enumerate(arguments), chunksize=chunksize):
+            results[index] = trajectory
+
+        return results
+
+
+def _get_pool():
+    """Return the shared worker pool, creating it if needed."""
+    global _POOL
+    if _POOL is None:
+        _POOL = _pool_context().Pool(processes=mp.cpu_count())
+    return _POOL
+
+
+def _close_pool():
+    """Shut down the shared worker pool, if any.
+
+    This affects every solver; the next parallel calculation starts a new
+    pool.
+    """
+    global _POOL
+    if _POOL is not None:
+        _POOL.close()
+        _POOL.join()
+        _POOL = None
+
+
+atexit.register(_close_pool)
+
+
+def _pool_context():
+    """Multiprocessing context that forks its workers on Linux.
+
+    Other platforms keep their default start method, since forking after
+    numpy or numba have been loaded is unsafe on macOS.
+    """
+    if sys.platform.startswith('linux') and hasattr(mp, 'get_context'):
+        return mp.get_context('fork')
+    return mp
+
 
 def calculate_ray(
         starting_point,
@@ -53,57 +129,59 @@ def calculate_ray(
     max_step = parameters.get('max_step', MAX_STEP)
     velocity_scale = parameters.get('velocity_scale', VELOCITY_SCALE)
     lim = parameters.get('lim', LIM)
+    method = parameters.get('method', METHOD)
 
     # Monodromy
     sqrt_monodromy = Monodromy(quad(starting_point))
-
-    # Iteration counter
-    iteration = 0
-
-    # Reference points
-    initial = starting_point
-    last = starting_point
-
-    # Trajectory points
-    trajectory = []
+    m_state = np.array([
+        sqrt_monodromy.phase,
+        sqrt_monodromy.point.real,
+        sqrt_monodromy.point.imag,
+        0.0])
 
     # Check for new phase
     if phase is None:
         phase = quad.phase
+    phase = complex(phase)
+
+    # Zeros and poles, specialized once per ray into the rows of a single
+    # array: real parts, imaginary parts and monomial orders
+    zeros, smplpoles, dblpoles = quad._arrays()
+    field_re, field_im = _real_imag(
+        np.concatenate([zeros, smplpoles, dblpoles]))
+    orders = np.repeat(
+        [1.0, -1.0, -2.0], [len(zeros), len(smplpoles), len(dblpoles)])
+    field = np.ascontiguousarray([field_re, field_im, orders])
+    poles_re, poles_im = _real_imag(np.concatenate([smplpoles, dblpoles]))
+
+    initial = complex(starting_point)
+    lim = float(lim)
+    sensitivity = float(quad.sensitivity)
+
+    # Rays starting next to a pole end right away, as the close_2pole
+    # event below only fires when a ray moves into the sensitivity radius
+    start = np.array([initial.real, initial.imag])
+    if _close_2pole(start, poles_re, poles_im, sensitivity) < 0:
+        return np.array([initial])
+
+    field_params = np.array(
+        [phase.real, phase.imag, velocity_scale, sign], dtype=np.float64)
 
     def vector_field(t, y):
-        real, img = y
-        comp = complex(real, img)
-        value = sqrt_monodromy(quad(comp, phase=phase).conjugate())
-        value *= velocity_scale
-        if abs(comp) > 1:
-            value *= abs(comp)
-        value *= sign
-        return value.real, value.imag
+        return _vector_field(t, y, field, field_params, m_state)
 
     # Termination events
     def far_away(t, y):
-        comp = complex(*y)
-        if abs(comp) > lim:
-            return 0
-        else:
-            return 1
+        return _far_away(y, lim)
     far_away.terminal = True
 
     def close_2pole(t, y):
-        comp = complex(*y)
-        if quad.close_2pole(comp):
-            return 0
-        else:
-            return 1
+        return _close_2pole(y, poles_re, poles_im, sensitivity)
     close_2pole.terminal = True
+    close_2pole.direction = -1
 
     def close_2start(t, y):
-        comp = complex(*y)
-        if (abs(comp - starting_point) <= 1e-2) and t > 100:
-            return 0
-        else:
-            return 1
+        return _close_2start(t, y, initial.real, initial.imag)
     close_2start.terminal = True
 
     # Calculate solution with solve_ivp
@@ -111,9 +189,127 @@ def calculate_ray(
     solution = solve_ivp(
         vector_field,
         (0, max_time),
-        np.array([initial.real, initial.imag]),
+        start,
         events=[far_away, close_2pole, close_2start],
-        max_step=max_step)
+        max_step=max_step,
+        method=method)
+
+    if m_state[3]:
+        logging.info('Large steps can lead to erroneous monodromy')
+
+    # View the (x, y) pairs as complex numbers
+    solution_points = np.ascontiguousarray(solution['y'].T)
+    return solution_points.view(np.complex128).ravel()
+
+
+def _real_imag(points):
+    """Split complex points into contiguous real and imaginary arrays."""
+    points = np.asarray(points, dtype=np.complex128)
+    return np.ascontiguousarray(points.real), np.ascontiguousarray(points.imag)
+
+
+@njit(cache=True)
+def _vector_field(t, y, field, params, m_state):
+    """Compiled vector field of the trajectory equation.
+
+    Evaluates sqrt_monodromy(quad(z, phase=phase).conjugate()). The rows of
+    field hold the real parts, imaginary parts and orders (1 for zeros, -1
+    for simple poles, -2 for double poles) of the zeros and poles, and
+    params holds (phase.real, phase.imag, velocity_scale, sign). The
+    monodromy is kept in m_state as (phase, point.real, point.imag,
+    large_step) and is updated in place, just like Monodromy.update;
+    large_step is set to 1 when an argument change exceeds pi / 2.
+    """
+    real = y[0]
+    imag = y[1]
+
+    # Multiply all normalized monomials
+    value_re = params[0]
+    value_im = params[1]
+    for k in range(field.shape[1]):
+        dx = real - field[0, k]
+        dy = imag - field[1, k]
+        norm = math.hypot(dx, dy)
+        if norm == 0.0:
+            return 0.0, 0.0
+        ur = dx / norm
+        ui = dy / norm
+
+        # Poles contribute the conjugate, double poles squared
+        order = field[2, k]
+        if order < 0:
+            ui = -ui
+        if order == -2:
+            ur, ui = ur * ur - ui * ui, 2.0 * ur * ui
+
+        value_re, value_im = (
+            value_re * ur - value_im * ui, value_re * ui + value_im * ur)
+
+    value_im = -value_im
+
+    # Monodromy update
+    norm = math.hypot(value_re, value_im)
+    new_re = value_re / norm
+    new_im = value_im / norm
+    change_re = new_re * m_state[1] + new_im * m_state[2]
+    change_im = new_im * m_state[1] - new_re * m_state[2]
+    arg_change = math.atan2(change_im, change_re)
+    if abs(arg_change) > (math.pi / 2):
+        m_state[3] = 1.0
+    m_state[0] += arg_change
+    m_state[1] = new_re
+    m_state[2] = new_im
+
+    # Branch selection, -1 if (phase - pi) % (4 pi) < 2 pi and 1 otherwise
+    turn = (m_state[0] - math.pi) % (4 * math.pi)
+    factor = 1.0 - 2.0 * (turn < (2 * math.pi))
+
+    # Principal square root
+    if value_re >= 0.0:
+        root_re = math.sqrt(0.5 * (norm + value_re))
+        root_im = value_im / (2.0 * root_re)
+    else:
+        root_im = math.copysign(math.sqrt(0.5 * (norm - value_re)), value_im)
+        root_re = value_im / (2.0 * root_im)
+
+    scale = factor * params[2] * params[3]
+    distance = math.hypot(real, imag)
+    if distance > 1:
+        scale *= distance
+    return scale * root_re, scale * root_im
+
+
+@njit(cache=True)
+def _far_away(y, lim):
+    if math.hypot(y[0], y[1]) > lim:
+        return 0.0
+    return 1.0
+
+
+@njit(cache=True)
+def _close_2pole(y, poles_re, poles_im, sensitivity):
+    """Distance to the closest pole minus the sensitivity."""
+    distance = np.inf
+    for k in range(poles_re.shape[0]):
+        distance = min(
+            distance, math.hypot(y[0] - poles_re[k], y[1] - poles_im[k]))
+    return distance - sensitivity
+
+
+@njit(cache=True)
+def _close_2start(t, y, start_re, start_im):
+    close = math.hypot(y[0] - start_re, y[1] - start_im) <= 1e-2
+    if close and t > 100:
+        return 0.0
+    return 1.0
+
 
-    solution_complex_list = [complex(*point) for point in solution['y'].T]
-    return solution_complex_list
+def _compile_kernels():
+    """Run every kernel once so they are compiled (or loaded from cache)."""
+    y = np.zeros(2)
+    points = np.zeros(1)
+    m_state = np.array([0.0, 1.0, 0.0, 0.0])
+    _vector_field(0.0, y + 1, np.zeros((3, 1)), np.ones(4), m_state)
+    _far_away(y, 1.0)
+    _close_2pole(y, points, points, 1.0)
+    _close_2start(0.0, y, 0.0, 0.0)
@@ -5,11 +5,11 @@ import numpy as np
 import logging
 import json
 import os
-from multiprocessing import Pool
 
-from ..utils import MethodProxy
 from ..core.trajectory import TrajectorySolver
 
+logger = logging.getLogger(__name__)
+
 
 class BasePlotter(object):
     """ Base Plotter class"""
@@ -50,14 +50,9 @@ class BasePlotter(object):
                      for point in self.plotpoints
                      for phase in self.phases
                      if (point, phase) not in self.trajectories]
-        print('{} trajectories to calculate'.format(len(arguments)))
-
-        pickable_method = MethodProxy(self.solver, self.solver._calculate)
+        logger.debug('%d trajectories to calculate', len(arguments))
 
-        pool = Pool()
-        results = pool.map(pickable_method, arguments)
-        pool.close()
-        pool.join()
+        results = self.solver.parallel_calculate(arguments)
 
         for arg, res in zip(arguments, results):
             self.trajectories[arg] = res
@@ -113,7 +108,8 @@ class BasePlotter(object):
             return point, phase
 
         parsed_trajectories = {
-            pkey(key): [complex(*x) for x in value]
+            pkey(key): np.array(value, dtype=np.float64).reshape(-1, 2).view(
+                np.complex128).ravel()
             for key, value in trajectories.iteritems()
         }
 
@@ -132,7 +128,7 @@ class BasePlotter(object):
                 msg += " the trajectories."
                 raise ValueError(msg)
         lines = self.get_trajectories(phase=phase)
-        self.plot(lines)
+        self.plot(lines.values())
         
     def __repr__(self):
         msg = '{}Plotter Object:\n'.format(self.name)
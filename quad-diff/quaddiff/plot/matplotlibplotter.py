@@ -1,3 +1,4 @@
+import numpy as np
 import matplotlib as mpl
 import matplotlib.pyplot as plt
 
@@ -5,12 +6,24 @@ from matplotlib.collections import LineCollection
 
 from .baseplotter import BasePlotter
 
+
+def _complex2XY(line):
+    """Convert a sequence of complex points into an (N, 2) array."""
+    line = np.asarray(line, dtype=np.complex128)
+    points = np.empty((len(line), 2))
+    points[:, 0] = line.real
+    points[:, 1] = line.imag
+    return points
+
+
 class MatplotlibPlotter(BasePlotter):
     name = 'Matplotlib'
 
     def plot(self, lines):
-        fig = plt.figure()
-        for line in lines:
-            X, Y = zip(*[(z.real, z.imag) for z in line])
-            plt.plot(X, Y)
+        segments = [_complex2XY(line) for line in lines]
+        colors = plt.rcParams['axes.prop_cycle'].by_key()['color']
+
+        _, ax = plt.subplots()
+        ax.add_collection(LineCollection(segments, colors=colors))
+        ax.autoscale_view()
         plt.show()
@@ -82,7 +82,10 @@ class BasePlotterTests(unittest.TestCase):
         self.plot.save_trajectories('/tmp', name=name)
         loaded_trajectories = self.plot.from_file('/tmp', name=name)
 
-        self.assertEqual(prev_trajectories, loaded_trajectories)
+        self.assertEqual(set(prev_trajectories), set(loaded_trajectories))
+        for key, trajectory in prev_trajectories.items():
+            np.testing.assert_array_equal(
+                trajectory, loaded_trajectories[key])
 
 
 class MatplotlibPlotterTests(unittest.TestCase):
@@ -52,6 +52,30 @@ class QuadraticDifferentialTests(unittest.TestCase):
         self.assertNotEqual(first, second)
         self.assertEqual(1j*first, second)
 
+    def test_cached_arrays(self):
+        self.qd.add_zero(1)
+        zeros, _, _ = self.qd._arrays()
+        self.assertIs(zeros, self.qd._arrays()[0])
+
+        self.qd.zeros += [2]
+        zeros, _, _ = self.qd._arrays()
+        self.assertEqual(list(zeros), [1, 2])
+
+        self.qd.add_smplpole(1j)
+        _, smplpoles, _ = self.qd._arrays()
+        self.assertEqual(list(smplpoles), [1j])
+
+    def test_in_place_changes(self):
+        self.qd.add_zero(1)
+        self.qd(2j)
+
+        self.qd.zeros.append(5)
+        expected = (2j - 1) / abs(2j - 1) * (2j - 5) / abs(2j - 5)
+        self.assertAlmostEqual(self.qd(2j), expected)
+
+        self.qd.zeros.remove(1)
+        self.assertAlmostEqual(self.qd(1), -1)
+
     def test_save_and_load(self):
         self.qd.add_zero(1)
         self.qd.add_zero(0)
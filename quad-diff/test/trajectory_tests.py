@@ -11,6 +11,7 @@ sys.path.insert(
 
 import quaddiff as qd  # pylint: disable=wrong-import-position
 import quaddiff.core.constants as constants
+import quaddiff.core.trajectory as trajectory_module
 
 class TrajectoryTests(unittest.TestCase):
     def setUp(self):
@@ -39,6 +40,47 @@ class TrajectoryTests(unittest.TestCase):
         for point in trajectory:
             self.assertEqual(round(point.real, 4), -round(point.imag, 4))
 
+    def test_lsoda_trajectory_calculation(self):
+        parameters = dict(self.trajectory.parameters, method='LSODA')
+        self.trajectory.parameters = parameters
+        trajectory = self.trajectory.calculate(self.point, phase=-1)
+
+        for point in trajectory:
+            self.assertEqual(point.real, 1)
+
+    def test_parallel_calculate(self):
+        self.qd.add_zero(2 + 0.5j)
+        # Repeated arguments must each get their own trajectory
+        arguments = [
+            (self.point, 1), (1j, 1j), (-1 + 0.5j, -1), (self.point, 1)]
+
+        trajectories = self.trajectory.parallel_calculate(arguments)
+        self.assertEqual(len(trajectories), len(arguments))
+        for (point, phase), trajectory in zip(arguments, trajectories):
+            expected = self.trajectory.calculate(point, phase=phase)
+            np.testing.assert_allclose(trajectory, expected)
+
+        pool = trajectory_module._POOL
+        self.assertIsNotNone(pool)
+        self.trajectory.parallel_calculate(arguments[:1])
+        self.assertIs(pool, trajectory_module._get_pool())
+
+        trajectory_module._close_pool()
+        self.assertIsNone(trajectory_module._POOL)
+        trajectories = self.trajectory.parallel_calculate(arguments[:1])
+        np.testing.assert_allclose(
+            trajectories[0], self.trajectory.calculate(self.point, phase=1))
+        trajectory_module._close_pool()
+
+    def test_start_close_to_pole(self):
+        self.qd.add_smplpole(0)
+        self.qd.add_zero(3)
+
+        trajectory = self.trajectory.calculate(0.005)
+
+        self.assertEqual(len(trajectory), 1)
+        self.assertTrue(abs(trajectory[0]) < self.qd.sensitivity)
+
     def test_boundary_condition(self):
         trajectory = self.trajectory.calculate(self.point)
 